@@ -2,6 +2,12 @@
 ########################## TRIANGULATION DE DELAUNAY ##########################
 ###############################################################################
 
+from bisect import bisect_left
+from collections import Counter
+from operator import itemgetter
+from math import ceil, floor, sqrt
+from random import shuffle
+
 DIRECT = 1
 ALIGNES = 0
 INDIRECT = -1
@@ -93,7 +99,7 @@ def variance_xy(points):
     var_y = (sum_sqy / n) - (sum_y / n) ** 2
     return var_x, var_y
 
-def delaunay_triangulation(points):
+def delaunay_diviser_pour_regner(points):
     """Calcule la triangulation de Delaunay d'une liste de points distincts du
     plan.
 
@@ -292,3 +298,719 @@ def delaunay_triangulation(points):
             
     compute(points)
     return succ
+
+def indice_hilbert(x, y, ordre):
+    """Renvoie la position de la case (x, y) le long de la courbe de Hilbert
+    qui parcourt une grille de taille 2**ordre x 2**ordre."""
+    d = 0
+    s = 1 << (ordre - 1)
+    while s > 0:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        #On ramène la sous-grille dans l'orientation de la courbe de départ :
+        if ry == 0:
+            if rx == 1:
+                x = s - 1 - x
+                y = s - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+def ordre_brio(points, ordre=None):
+    """Renvoie les points dans un ordre d'insertion « BRIO » (biased
+    randomized insertion order).
+
+    Les points sont mélangés, puis la liste est coupée en deux moitiés : la
+    seconde forme la dernière série, et on recommence avec la première
+    moitié, jusqu'à ce qu'il ne reste qu'un point. Les séries sont insérées
+    de la plus petite à la plus grande, et les points de chaque série sont
+    triés selon la courbe de Hilbert : deux points consécutifs sont ainsi
+    proches en général, ce qui raccourcit les marches de localisation, tout
+    en conservant le caractère aléatoire de l'insertion.
+
+    Par défaut, la grille de la courbe de Hilbert a environ 16 * sqrt(n)
+    cases de côté, ce qui suffit à séparer les points les uns des autres sans
+    calculer inutilement des indices trop longs."""
+    if ordre is None:
+        ordre = (len(points).bit_length() + 1) // 2 + 4
+    cote = 1 << ordre
+    #On remplace chaque coordonnée par son rang parmi les coordonnées
+    #distinctes : la grille s'adapte ainsi aux points regroupés, comme si
+    #l'on coupait l'espace selon des médianes plutôt qu'en cases égales.
+    xs = sorted(set(x for (x, y) in points))
+    ys = sorted(set(y for (x, y) in points))
+    rang_x = {x: k * cote // len(xs) for (k, x) in enumerate(xs)}
+    rang_y = {y: k * cote // len(ys) for (k, y) in enumerate(ys)}
+
+    def cle(p):
+        x, y = p
+        return indice_hilbert(rang_x[x], rang_y[y], ordre)
+
+    series = []
+    restants = points[:]
+    shuffle(restants)
+    while len(restants) > 1:
+        series.append(restants[len(restants) // 2:])
+        restants = restants[:len(restants) // 2]
+    series.append(restants)
+    resultat = []
+    for serie in reversed(series):
+        resultat.extend(sorted(serie, key=cle))
+    return resultat
+
+#Le sommet fictif « à l'infini », relié à tous les points de l'enveloppe
+#convexe. Les triangles ayant ce sommet sont appelés triangles fantômes.
+INFINI = None
+
+def delaunay_incrementale(points):
+    """Calcule la triangulation de Delaunay d'une liste de points distincts du
+    plan, par insertions successives (algorithme de Bowyer-Watson).
+
+    Les points sont insérés dans un ordre BRIO (voir ordre_brio) ; chaque
+    point est localisé par une marche à partir du dernier triangle créé, puis
+    les triangles dont le cercle circonscrit contient le nouveau point sont
+    remplacés par l'étoile de ce point.
+
+    Renvoie le même dictionnaire succ que delaunay_diviser_pour_regner.
+
+    Préconditions :
+    -la liste points contient au moins deux éléments
+    -les points sont tous distincts"""
+    points = ordre_brio(points)
+    n = len(points)
+
+    #Recherche d'un premier triangle non plat :
+    a, b = points[0], points[1]
+    k = 2
+    while k < n and orientation(a, b, points[k]) == ALIGNES:
+        k += 1
+    if k == n:
+        #Tous les points sont alignés : on relie chaque point au suivant.
+        points.sort()
+        succ = {}
+        for i in range(n - 1):
+            a, b = points[i], points[i + 1]
+            succ[a, b] = points[i - 1] if i > 0 else b
+            succ[b, a] = points[i + 2] if i + 2 < n else a
+        return succ
+    c = points[k]
+    if orientation(a, b, c) == INDIRECT:
+        b, c = c, b
+    #Les trois premiers sommets sont points[0], points[1] et points[k].
+
+    #opp : un dictionnaire qui associe à chaque arête orientée (a, b) le
+    #sommet c tel que (a, b, c) est un triangle direct, éventuellement
+    #fantôme (c, ou a, ou b vaut alors INFINI).
+    opp = {}
+
+    def ajoute(a, b, c):
+        opp[a, b] = c
+        opp[b, c] = a
+        opp[c, a] = b
+
+    def retire(a, b, c):
+        del opp[a, b]
+        del opp[b, c]
+        del opp[c, a]
+
+    def en_conflit(a, b, c, p):
+        """Indique si le cercle circonscrit au triangle (a, b, c) contient
+        strictement le point p. Pour un triangle fantôme, le « cercle » est
+        le demi-plan à gauche de son arête finie, auquel on ajoute l'intérieur
+        de cette arête."""
+        if c is INFINI:
+            o = orientation(a, b, p)
+            return o == DIRECT or \
+                (o == ALIGNES and min(a, b) < p < max(a, b))
+        if a is INFINI:
+            return en_conflit(b, c, a, p)
+        if b is INFINI:
+            return en_conflit(c, a, b, p)
+        return position_cercle_circonscrit(a, b, c, p) == DEDANS
+
+    def localise(a, b, p):
+        """Marche à partir du triangle de l'arête (a, b) jusqu'à un triangle
+        contenant p, ou jusqu'à un triangle fantôme dont l'arête finie voit
+        p. Renvoie une arête de ce triangle."""
+        while True:
+            c = opp[a, b]
+            if c is INFINI:
+                return a, b
+            if orientation(a, b, p) == INDIRECT:
+                a, b = b, a
+            elif orientation(b, c, p) == INDIRECT:
+                a, b = c, b
+            elif orientation(c, a, p) == INDIRECT:
+                a, b = a, c
+            else:
+                return a, b
+
+    ajoute(a, b, c)
+    ajoute(b, a, INFINI)
+    ajoute(c, b, INFINI)
+    ajoute(a, c, INFINI)
+    dernier = (a, b)
+
+    for p in points[2:k] + points[k+1:]:
+        a, b = localise(*dernier, p)
+        #Parcours de la cavité : les triangles en conflit avec p, à partir du
+        #triangle qui le contient. Un triangle est repéré par ses trois arêtes
+        #orientées dans aretes_cavite ; les arêtes du bord de la cavité sont
+        #conservées dans bord.
+        cavite = [(a, b, opp[a, b])]
+        aretes_cavite = {(a, b), (b, opp[a, b]), (opp[a, b], a)}
+        bord = []
+        i = 0
+        while i < len(cavite):
+            t = cavite[i]
+            i += 1
+            for (u, v) in ((t[0], t[1]), (t[1], t[2]), (t[2], t[0])):
+                if (v, u) in aretes_cavite:
+                    continue
+                w = opp[v, u]
+                if en_conflit(v, u, w, p):
+                    cavite.append((v, u, w))
+                    aretes_cavite.update(((v, u), (u, w), (w, v)))
+                else:
+                    bord.append((u, v))
+        for t in cavite:
+            retire(*t)
+        for (u, v) in bord:
+            ajoute(u, v, p)
+            if u is not INFINI and v is not INFINI:
+                dernier = (u, v)
+
+    #Construction de succ : autour du point a, l'arête (a, opp[a, b]) suit
+    #immédiatement l'arête (a, b) dans le sens trigonométrique. Si ce point
+    #est le sommet infini, on continue de l'autre côté de l'enveloppe.
+    succ = {}
+    for (a, b), c in opp.items():
+        if a is INFINI or b is INFINI:
+            continue
+        succ[a, b] = c if c is not INFINI else opp[a, INFINI]
+    return succ
+
+def pas_dominant(compte):
+    """Renvoie le pas le plus probable d'une grille à partir du dictionnaire
+    compte qui associe à chaque coordonnée son nombre d'occurrences, ou None
+    s'il n'y en a pas.
+
+    Seules les coordonnées fréquentes (au moins le quart de la plus fréquente,
+    et au moins deux fois) sont retenues : les colonnes ou lignes de la grille
+    en font partie, alors que les points hors de la grille ont en général des
+    coordonnées isolées, qui couperaient les écarts entre colonnes. Le pas est
+    l'écart le plus fréquent entre deux coordonnées retenues consécutives."""
+    seuil = max(2, max(compte.values()) // 4)
+    valeurs = sorted(v for (v, c) in compte.items() if c >= seuil)
+    if len(valeurs) < 2:
+        return None
+    ecarts = Counter(valeurs[k + 1] - valeurs[k]
+                     for k in range(len(valeurs) - 1))
+    return ecarts.most_common(1)[0][0]
+
+def detecte_grille(points):
+    """Cherche le réseau régulier (x0, y0, pas_x, pas_y) qui contient la plus
+    grande partie des points, c'est-à-dire tel que beaucoup de points
+    s'écrivent (x0 + i * pas_x, y0 + j * pas_y) avec i et j entiers.
+
+    Les pas sont estimés par pas_dominant à partir des abscisses et des
+    ordonnées, et (x0, y0) est un point dont les voisins (x0 + pas_x, y0) et
+    (x0, y0 + pas_y) sont présents. Les coordonnées peuvent être flottantes.
+    Renvoie None si les points ne ressemblent visiblement pas à une grille :
+    trop d'abscisses ou d'ordonnées distinctes, ou trop peu de points dont
+    les voisins de droite et du haut sont présents. Ces tests sont peu
+    coûteux par rapport au calcul de la triangulation."""
+    n = len(points)
+    xs = Counter(map(itemgetter(0), points))
+    if 2 * len(xs) > n:
+        return None
+    ys = Counter(map(itemgetter(1), points))
+    if 2 * len(ys) > n:
+        return None
+    pas_x = pas_dominant(xs)
+    pas_y = pas_dominant(ys)
+    if pas_x is None or pas_y is None:
+        return None
+    #On estime la proportion de points dont les voisins de droite et du haut
+    #sont présents sur un échantillon d'environ mille points.
+    presents = set(points)
+    echantillon = points[::max(1, n // 1000)]
+    voisins = [(x, y) for (x, y) in echantillon
+               if (x + pas_x, y) in presents and (x, y + pas_y) in presents]
+    if 3 * len(voisins) < len(echantillon):
+        return None
+    x0, y0 = voisins[0]
+    return x0, y0, pas_x, pas_y
+
+def succ_depuis_triangles(triangles):
+    """Construit le dictionnaire succ d'une triangulation à partir de la liste
+    de ses triangles, tous orientés dans le sens direct.
+
+    Précondition : les triangles recouvrent l'enveloppe convexe de leurs
+    sommets sans se chevaucher."""
+    #suivant[a, b] = c si (a, b, c) est un triangle direct.
+    suivant = {}
+    for (a, b, c) in triangles:
+        suivant[a, b] = c
+        suivant[b, c] = a
+        suivant[c, a] = b
+    #Si (a, b) est une arête de l'enveloppe convexe parcourue dans le sens
+    #trigonométrique, il n'y a pas de triangle à gauche de (b, a) : autour de
+    #b, le voisin qui suit a est alors c, où (b, c) est l'arête suivante de
+    #l'enveloppe.
+    enveloppe = [(a, b) for (a, b) in suivant if (b, a) not in suivant]
+    depart = dict(enveloppe)
+    succ = suivant
+    for (a, b) in enveloppe:
+        succ[b, a] = depart[b]
+    return succ
+
+def delaunay_grille(points, engine="dc"):
+    """Calcule la triangulation de Delaunay d'une liste de points distincts
+    dont une grande partie est prise sur un réseau régulier (une grille,
+    éventuellement trouée, voir detecte_grille), ou renvoie None si les
+    points ne sont pas de cette forme.
+
+    Une cellule de la grille dont les quatre coins sont présents a un cercle
+    circonscrit qui ne contient aucun autre point du réseau, même sur le
+    cercle. Si aucun des points hors du réseau n'est non plus dans ce cercle
+    ou sur ce cercle, la cellule appartient à la triangulation de Delaunay,
+    et on la coupe toujours selon la diagonale allant de son coin inférieur
+    gauche à son coin supérieur droit. Les points du réseau dont les quatre
+    cellules voisines sont ainsi pleines n'appartiennent à aucun autre
+    triangle ; on calcule la triangulation des autres points (points hors du
+    réseau compris) avec l'algorithme engine, et on n'en garde que les
+    triangles qui ne sont pas dans une cellule pleine.
+
+    Un point n'est considéré sur le réseau que si x0 + i * pas_x est
+    exactement égal à son abscisse (et de même pour l'ordonnée) : pour des
+    coordonnées flottantes, le pas doit donc être exactement représentable."""
+    n = len(points)
+    reseau = detecte_grille(points)
+    if reseau is None:
+        return None
+    x0, y0, pas_x, pas_y = reseau
+
+    #sommets[i, j] : le point d'indices (i, j) du réseau.
+    sommets = {}
+    hors_reseau = []
+    for (x, y) in points:
+        i = round((x - x0) / pas_x)
+        j = round((y - y0) / pas_y)
+        if x0 + i * pas_x == x and y0 + j * pas_y == y:
+            sommets[i, j] = (x, y)
+        else:
+            hors_reseau.append((x, y))
+    pleines = set((i, j) for (i, j) in sommets
+                  if (i + 1, j) in sommets and (i, j + 1) in sommets
+                  and (i + 1, j + 1) in sommets)
+    #Chaque point intérieur est le coin supérieur droit d'une cellule pleine.
+    if 3 * len(pleines) < n:
+        return None
+
+    #On retire les cellules dont le cercle circonscrit contient un point hors
+    #du réseau, ou passe par lui. Ce cercle, de rayon r, ne dépasse pas la
+    #cellule de plus de r dans chaque direction.
+    r = sqrt(pas_x ** 2 + pas_y ** 2) / 2
+    kx = ceil(r / pas_x) + 1
+    ky = ceil(r / pas_y) + 1
+    for p in hors_reseau:
+        ci = floor((p[0] - x0) / pas_x)
+        cj = floor((p[1] - y0) / pas_y)
+        for i in range(ci - kx, ci + kx + 1):
+            for j in range(cj - ky, cj + ky + 1):
+                if (i, j) in pleines and position_cercle_circonscrit(
+                        sommets[i, j], sommets[i + 1, j],
+                        sommets[i + 1, j + 1], p) != DEHORS:
+                    pleines.remove((i, j))
+
+    reste = hors_reseau + [p for ((i, j), p) in sommets.items()
+                           if not ((i - 1, j - 1) in pleines
+                                   and (i, j - 1) in pleines
+                                   and (i - 1, j) in pleines
+                                   and (i, j) in pleines)]
+    if 3 * (n - len(reste)) < n:
+        #Trop peu de points sont intérieurs à la partie régulière de la
+        #grille : l'algorithme général ne ferait guère moins de travail.
+        return None
+
+    triangles = []
+    for (i, j) in pleines:
+        a, b = sommets[i, j], sommets[i + 1, j]
+        c, d = sommets[i + 1, j + 1], sommets[i, j + 1]
+        triangles.append((a, b, c))
+        triangles.append((a, c, d))
+
+    #indices[p] = (i, j) si p = sommets[i, j].
+    indices = {p: ij for (ij, p) in sommets.items()}
+    succ = delaunay_triangulation(reste, engine, grille=False)
+    for (a, b), c in succ.items():
+        if a < b and a < c and succ.get((b, c)) == a and \
+           orientation(a, b, c) == DIRECT:
+            #Le triangle (a, b, c) est soit dans une cellule pleine, soit en
+            #dehors de toutes. Dans le premier cas, ses sommets sont sur le
+            #réseau, et la cellule qui contient son centre de gravité, qui
+            #est strictement à l'intérieur du triangle, est pleine.
+            if a in indices and b in indices and c in indices:
+                (ia, ja), (ib, jb) = indices[a], indices[b]
+                (ic, jc) = indices[c]
+                if ((ia + ib + ic) // 3, (ja + jb + jc) // 3) in pleines:
+                    continue
+            triangles.append((a, b, c))
+    return succ_depuis_triangles(triangles)
+
+MOTEURS = ("dc", "incremental", "auto")
+
+def choix_moteur(points):
+    """Choisit l'algorithme le plus adapté à une liste de points à partir de
+    statistiques peu coûteuses à calculer.
+
+    On préfère l'insertion incrémentale pour au moins 40000 points fortement
+    concentrés (la variance d'une coordonnée est inférieure au centième de
+    celle de points uniformément répartis dans la boîte englobante), car les
+    pseudo-médianes donnent alors des découpages déséquilibrés. Sinon, on
+    utilise l'algorithme 'divide and conquer'.
+
+    Ces seuils viennent de mesures sur des points aléatoires : sur des
+    distributions à queue lourde (loi de Cauchy) ou un amas entouré de
+    points isolés, l'insertion incrémentale est environ 1,5 fois plus rapide
+    à partir de 40000 points, et aussi rapide à 20000 points. En revanche,
+    l'algorithme 'divide and conquer' est plus rapide sur les grilles, les
+    points répartis sur quelques droites et les bandes étroites, même
+    lorsque beaucoup de points ont la même abscisse ou la même ordonnée."""
+    n = len(points)
+    if n < 40000:
+        return "dc"
+    var_x, var_y = variance_xy(points)
+    xs = [x for (x, y) in points]
+    ys = [y for (x, y) in points]
+    #variance de points uniformément répartis dans la boîte englobante :
+    uni_x = (max(xs) - min(xs)) ** 2 / 12
+    uni_y = (max(ys) - min(ys)) ** 2 / 12
+    if var_x < uni_x / 100 or var_y < uni_y / 100:
+        return "incremental"
+    return "dc"
+
+def delaunay_triangulation(points, engine="dc", grille=True):
+    """Calcule la triangulation de Delaunay d'une liste de points distincts du
+    plan.
+
+    Le paramètre engine choisit l'algorithme : "dc" pour l'algorithme
+    'divide and conquer' (delaunay_diviser_pour_regner), "incremental" pour
+    l'insertion incrémentale (delaunay_incrementale), et "auto" pour laisser
+    choix_moteur décider. Les deux algorithmes renvoient le même dictionnaire
+    succ, au choix près des diagonales en cas de points cocirculaires.
+
+    Si grille est vrai et que les points sont pris sur un réseau régulier,
+    les cellules pleines de la grille sont triangulées directement et
+    l'algorithme choisi n'est utilisé que pour le reste (voir delaunay_grille).
+
+    Préconditions :
+    -la liste points contient au moins deux éléments
+    -les points sont tous distincts"""
+    if engine not in MOTEURS:
+        raise ValueError("moteur inconnu : {!r}".format(engine))
+    if grille:
+        succ = delaunay_grille(points, engine)
+        if succ is not None:
+            return succ
+    if engine == "auto":
+        engine = choix_moteur(points)
+    if engine == "incremental":
+        return delaunay_incrementale(points)
+    return delaunay_diviser_pour_regner(points)
+
+def cercle_circonscrit(a, b, c):
+    """Renvoie le couple (o, r) avec o le centre du cercle circonscrit à
+    a, b, c et r le rayon, calculés en nombres flottants.
+
+    Précondition : les points a, b, c ne sont pas alignés."""
+    xa, ya = a
+    xb, yb = b
+    xc, yc = c
+    d = 2 * (xa * (yb - yc) + xb * (yc - ya) + xc * (ya - yb))
+    xo = ((xa**2 + ya**2)*(yb - yc) + (xb**2 + yb**2)*(yc - ya)
+          + (xc**2 + yc**2)*(ya - yb)) / d
+    yo = ((xa**2 + ya**2)*(xc - xb) + (xb**2 + yb**2)*(xa - xc)
+          + (xc**2 + yc**2)*(xb - xa)) / d
+    r = sqrt((xa - xo) ** 2 + (ya - yo) ** 2)
+    return (xo, yo), r
+
+def cercle_contenu(a, b, c, xmin, ymin, xmax, ymax):
+    """Indique si le disque circonscrit au triangle (a, b, c) est inclus dans
+    le rectangle [xmin, xmax] x [ymin, ymax].
+
+    Pour éviter les divisions, toutes les longueurs sont multipliées par le
+    dénominateur d des coordonnées du centre : le calcul est exact pour des
+    points à coordonnées entières.
+
+    Précondition : les points a, b, c ne sont pas alignés."""
+    xa, ya = a
+    xb, yb = b
+    xc, yc = c
+    d = 2 * (xa * (yb - yc) + xb * (yc - ya) + xc * (ya - yb))
+    #le centre du cercle est (xo / d, yo / d) :
+    xo = (xa**2 + ya**2)*(yb - yc) + (xb**2 + yb**2)*(yc - ya) + \
+         (xc**2 + yc**2)*(ya - yb)
+    yo = (xa**2 + ya**2)*(xc - xb) + (xb**2 + yb**2)*(xa - xc) + \
+         (xc**2 + yc**2)*(xb - xa)
+    if d < 0:
+        d, xo, yo = -d, -xo, -yo
+    r2 = (xa * d - xo) ** 2 + (ya * d - yo) ** 2
+    for ecart in (xo - xmin * d, xmax * d - xo, yo - ymin * d, ymax * d - yo):
+        if ecart < 0 or ecart ** 2 < r2:
+            return False
+    return True
+
+def polygone_de_delaunay(succ, a, b):
+    """Renvoie, dans le sens trigonométrique et en commençant par a, les
+    sommets du polygone de Delaunay qui contient le triangle direct
+    (a, b, succ[a, b]), c'est-à-dire l'union des triangles de la
+    triangulation succ dont les sommets sont sur le même cercle que a, b et
+    succ[a, b]. Ce polygone ne dépend pas du choix des diagonales.
+
+    Précondition : (a, b, succ[a, b]) est un triangle de succ."""
+    c = succ[a, b]
+
+    def dans_polygone(u, x):
+        """Indique si le triangle (u, x, succ[u, x]) appartient au
+        polygone."""
+        y = succ[u, x]
+        return orientation(u, x, y) == DIRECT and succ.get((x, y)) == u and \
+            position_cercle_circonscrit(a, b, c, x) == CERCLE and \
+            position_cercle_circonscrit(a, b, c, y) == CERCLE
+
+    #On parcourt le bord du polygone dans le sens des aiguilles d'une montre :
+    #autour du sommet u, on tourne dans le sens trigonométrique à partir
+    #d'une arête (u, x) du polygone jusqu'à sortir du polygone ; le dernier
+    #voisin atteint est le sommet qui précède u sur le bord.
+    sommets = [a]
+    u, x = a, b
+    while True:
+        while dans_polygone(u, x):
+            x = succ[u, x]
+        if x == a:
+            break
+        sommets.append(x)
+        u, x = x, u
+    return [a] + sommets[:0:-1]
+
+def arete_interne(succ, u, v, internes):
+    """Indique si l'arête (u, v) sépare deux triangles de succ qui ont le
+    même cercle circonscrit, c'est-à-dire si elle est intérieure à un
+    polygone de Delaunay. Le résultat est conservé dans le dictionnaire
+    internes, pour que chaque arête ne soit testée qu'une fois."""
+    cle = (u, v) if u < v else (v, u)
+    if cle not in internes:
+        w = succ[u, v]
+        z = succ[v, u]
+        internes[cle] = \
+            orientation(u, v, w) == DIRECT and succ.get((v, w)) == u and \
+            orientation(v, u, z) == DIRECT and succ.get((u, z)) == v and \
+            position_cercle_circonscrit(u, v, w, z) == CERCLE
+    return internes[cle]
+
+def etoile_periodique(succ, a, voisins, internes, polygones):
+    """Renvoie les voisins du point a, dans le sens trigonométrique, une fois
+    les polygones de Delaunay autour de a retriangulés de façon identique
+    dans toutes les copies.
+
+    La triangulation succ peut couper différemment deux copies d'un même
+    polygone formé de points cocirculaires. On triangule donc chacun de ces
+    polygones en éventail à partir de son plus petit sommet dans l'ordre
+    lexicographique : ce choix est invariant par translation, et coupe une
+    cellule de grille selon la même diagonale que delaunay_grille.
+
+    voisins est la liste des voisins de a dans succ, dans le sens
+    trigonométrique. Les dictionnaires internes (voir arete_interne) et
+    polygones sont partagés entre les appels : polygones[u, v] est le
+    polygone de Delaunay dont (u, v) est une arête du bord parcouru dans le
+    sens trigonométrique, donné à partir de u."""
+    m = len(voisins)
+    debuts = [k for k in range(m)
+              if not arete_interne(succ, a, voisins[k], internes)]
+    exterieures = [not arete_interne(succ, voisins[k], voisins[(k+1) % m],
+                                     internes) for k in range(m)]
+    if len(debuts) == m and all(exterieures):
+        #Cas le plus courant : aucun point cocirculaire autour de a.
+        return voisins
+    resultat = []
+    for (rang, k) in enumerate(debuts):
+        polygone = polygones.get((a, voisins[k]))
+        if polygone is None:
+            #Les triangles (a, voisins[i], voisins[i+1]) pour i allant de k à
+            #fin - 1 sont ceux du polygone qui contiennent a. Si leurs arêtes
+            #opposées à a sont toutes au bord, ce sont les seuls.
+            fin = debuts[(rang + 1) % len(debuts)]
+            indices = range(k, fin if fin > k else fin + m)
+            if all(exterieures[i % m] for i in indices):
+                polygone = [a] + [voisins[i % m] for i in indices] + \
+                           [voisins[fin]]
+            else:
+                polygone = polygone_de_delaunay(succ, a, voisins[k])
+            for i in range(len(polygone)):
+                polygones[polygone[i], polygone[(i+1) % len(polygone)]] = \
+                    polygone[i:] + polygone[:i]
+        sommet = min(polygone)
+        if sommet == a:
+            resultat.extend(polygone[1:-1])
+        else:
+            resultat.append(polygone[1])
+            if sommet not in (polygone[1], polygone[-1]):
+                resultat.append(sommet)
+    return resultat
+
+def marge_initiale(points, largeur, hauteur):
+    """Estime la largeur de la bande à recopier autour du rectangle
+    [0, largeur[ x [0, hauteur[ pour la triangulation périodique.
+
+    Pour n points répartis uniformément, une marge de 3 fois la distance
+    moyenne entre deux points, sqrt(largeur * hauteur / n), suffit en
+    général : la bande de largeur m le long d'un côté de longueur l contient
+    alors au moins 9 * l / m points. On agrandit la marge jusqu'à ce que
+    chacune des quatre bandes vérifie cette condition, ce qui tient compte
+    des points regroupés loin des bords. De plus, les triangles qui
+    traversent un bord vide sont au moins aussi larges que l'espace qui
+    sépare les points de leurs copies : la marge est au moins égale à cet
+    espace."""
+    n = len(points)
+    xs = sorted(x for (x, y) in points)
+    ys = sorted(y for (x, y) in points)
+    marge = max(3 * sqrt(largeur * hauteur / n),
+                largeur - (xs[-1] - xs[0]), hauteur - (ys[-1] - ys[0]))
+    while marge < max(largeur, hauteur) / 2:
+        #Nombre de points recopiés dans chacune des quatre bandes :
+        bandes = ((bisect_left(xs, marge), hauteur),
+                  (n - bisect_left(xs, largeur - marge), hauteur),
+                  (bisect_left(ys, marge), largeur),
+                  (n - bisect_left(ys, hauteur - marge), largeur))
+        if all(nombre * marge >= 9 * cote for (nombre, cote) in bandes):
+            break
+        marge *= 1.5
+    return marge
+
+def delaunay_triangulation_periodique(points, largeur, hauteur, engine="dc",
+                                      grille=True):
+    """Calcule la triangulation de Delaunay d'une liste de points distincts du
+    tore plat obtenu en identifiant les bords opposés du rectangle
+    [0, largeur[ x [0, hauteur[.
+
+    Plutôt que de recopier tous les points dans un pavage 3 x 3, on ne
+    recopie que ceux qui se trouvent dans une bande de largeur 'marge' autour
+    du rectangle, puis on calcule la triangulation de Delaunay du plan de ces
+    points. Un triangle dont le disque circonscrit est inclus dans la zone
+    recopiée ne contient aucune copie d'un point : il appartient donc à la
+    triangulation périodique. Si l'un des triangles autour d'un point
+    d'origine n'est pas certifié de cette façon, on agrandit la marge (au
+    moins jusqu'à contenir les cercles non certifiés) et on recommence ; dès
+    que la marge atteint la moitié du rectangle, on recopie directement le
+    pavage 3 x 3.
+
+    Renvoie un dictionnaire succ analogue à celui de delaunay_triangulation,
+    mais dont les sommets voisins sont accompagnés d'un décalage : si
+    succ[a, (b, (i, j))] = (c, (k, l)), alors autour du point a, l'arête
+    menant à la copie de c translatée de (k * largeur, l * hauteur) suit
+    immédiatement, dans le sens trigonométrique, l'arête menant à la copie
+    de b translatée de (i * largeur, j * hauteur).
+
+    Les paramètres engine et grille sont transmis à delaunay_triangulation.
+    Les polygones de points cocirculaires sont triangulés de la même façon
+    dans toutes les copies (voir etoile_periodique).
+
+    Préconditions :
+    -la liste points contient au moins un élément
+    -les points sont tous distincts et appartiennent au rectangle
+    [0, largeur[ x [0, hauteur["""
+    n = len(points)
+    for (x, y) in points:
+        assert 0 <= x < largeur and 0 <= y < hauteur, (x, y)
+    entiers = isinstance(largeur, int) and isinstance(hauteur, int) and \
+        all(isinstance(x, int) and isinstance(y, int) for (x, y) in points)
+    marge_x = marge_y = marge_initiale(points, largeur, hauteur)
+
+    while True:
+        if marge_x >= largeur / 2 or marge_y >= hauteur / 2:
+            #La bande n'est alors guère moins coûteuse que le pavage 3 x 3 :
+            #on recopie directement tous les points.
+            marge_x = max(marge_x, largeur)
+            marge_y = max(marge_y, hauteur)
+        if entiers:
+            #On garde des bornes entières pour que cercle_contenu soit exact.
+            marge_x, marge_y = ceil(marge_x), ceil(marge_y)
+        xmin, ymin = -marge_x, -marge_y
+        xmax, ymax = largeur + marge_x, hauteur + marge_y
+        #origine[p] = (q, (i, j)) si p est la copie de q translatée de
+        #(i * largeur, j * hauteur).
+        origine = {}
+        ki = ceil(marge_x / largeur)
+        kj = ceil(marge_y / hauteur)
+        for i in range(-ki, ki + 1):
+            for j in range(-kj, kj + 1):
+                for (x, y) in points:
+                    p = (x + i * largeur, y + j * hauteur)
+                    if xmin <= p[0] <= xmax and ymin <= p[1] <= ymax:
+                        origine[p] = ((x, y), (i, j))
+
+        succ = delaunay_triangulation(list(origine), engine, grille)
+
+        #voisin[a] : un voisin quelconque du point a.
+        voisin = {a: b for (a, b) in succ}
+        originaux = set(points)
+        certifie = True
+        #Si la certification échoue, estimation de la marge nécessaire
+        #d'après les cercles des triangles non certifiés (None si l'un d'eux
+        #n'est pas un vrai triangle).
+        besoin = 0
+        etoiles = []
+        for a in points:
+            #Les voisins de a dans le sens trigonométrique :
+            voisins = [voisin[a]]
+            while True:
+                b = voisins[-1]
+                c = succ[a, b]
+                #On vérifie que (a, b, c) est bien un triangle de la
+                #triangulation, puis que son disque circonscrit est inclus
+                #dans la zone recopiée. Ce second test n'est fait que depuis
+                #le plus petit sommet d'origine du triangle.
+                if orientation(a, b, c) != DIRECT or succ[b, c] != a:
+                    certifie = False
+                    besoin = None
+                    break
+                if not (b < a and b in originaux) and \
+                   not (c < a and c in originaux) and \
+                   not cercle_contenu(a, b, c, xmin, ymin, xmax, ymax):
+                    certifie = False
+                    if besoin is not None:
+                        (xo, yo), r = cercle_circonscrit(a, b, c)
+                        besoin = max(besoin, r - xo, xo + r - largeur,
+                                     r - yo, yo + r - hauteur)
+                if c == voisins[0]:
+                    break
+                voisins.append(c)
+            if besoin is None:
+                break
+            etoiles.append((a, voisins))
+
+        if certifie:
+            resultat = {}
+            internes = {}
+            polygones = {}
+            for (a, voisins) in etoiles:
+                voisins = etoile_periodique(succ, a, voisins, internes,
+                                            polygones)
+                for k in range(len(voisins)):
+                    resultat[a, origine[voisins[k - 1]]] = origine[voisins[k]]
+            #Les diagonales étant choisies de la même façon dans toutes les
+            #copies, chaque arête doit apparaitre dans les deux sens.
+            for (a, (b, (i, j))) in resultat:
+                assert (b, (a, (-i, -j))) in resultat, (a, b, (i, j))
+            return resultat
+        #On agrandit la bande au moins jusqu'à la marge estimée, et au moins
+        #d'un facteur 2 pour être sûr de finir. Si un point d'origine est sur
+        #l'enveloppe convexe, la bande est presque vide : on passe alors
+        #directement au pavage 3 x 3.
+        if besoin is None:
+            besoin = max(largeur, hauteur)
+        marge_x = max(2 * marge_x, 1.25 * besoin)
+        marge_y = max(2 * marge_y, 1.25 * besoin)
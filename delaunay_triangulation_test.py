@@ -22,10 +22,13 @@ def test_triangulation(points, triangulation):
         d = triangulation[c, b]
         if orientation(a, b, c) == DIRECT:
             assert position_cercle_circonscrit(a, b, c, d) != DEDANS
-        if orientation(a, b, c) == INDIRECT:
+        #Si le triangle est indirect, c suit b autour de a en passant par
+        #l'extérieur de l'enveloppe convexe : (a, c, b) n'est un triangle que
+        #si b suit aussi c autour de a.
+        if orientation(a, b, c) == INDIRECT and triangulation[a, c] == b:
             assert position_cercle_circonscrit(a, c, b, d) != DEDANS
 
-from random import randrange, sample
+from random import random, randrange, sample
 
 #« Test du test » : on vérifie que le test passe pour une triangulation
 #correcte et échoue pour une triangulation incorrecte.
@@ -80,5 +83,122 @@ points0 = set(points)
 for n in (100, 1000, 10000):
     points = genere(n, 10000, points0)
     test_triangulation(points, delaunay_triangulation(points))
-    
+
+#Tests de l'insertion incrémentale : pour des points en position générale,
+#la triangulation de Delaunay est unique, les deux algorithmes doivent donc
+#renvoyer exactement le même dictionnaire.
+for nb_points in (2, 3, 4, 5, 10, 100, 1000, 10000):
+    print("Test incrémental avec {} points aléatoires".format(nb_points))
+    points = genere(nb_points, 10 ** 9)
+    assert delaunay_triangulation(points, engine="incremental") == \
+           delaunay_triangulation(points, engine="dc")
+
+lx = sample(list(range(10000)), 1000)
+points = [(x, x) for x in lx]
+assert delaunay_triangulation(points, engine="incremental") == \
+       delaunay_triangulation(points, engine="dc")
+
+for nb_points in (10, 1000):
+    points = genere(nb_points, 100)
+    test_triangulation(points, delaunay_triangulation(points, engine="auto"))
+    test_triangulation(points,
+                       delaunay_triangulation(points, engine="incremental"))
+
+try:
+    delaunay_triangulation(points, engine="inconnu")
+    raise Exception("Le test aurait du échouer.")
+except ValueError:
+    pass
+
+#Tests avec des points pris sur une grille trouée : les cellules pleines
+#sont triangulées directement, le reste par l'algorithme général. Les deux
+#triangulations n'ont pas forcément les mêmes diagonales, mais elles ont le
+#même nombre d'arêtes.
+for (largeur, hauteur, trous) in ((2, 2, 0), (10, 7, 0), (100, 100, 100),
+                                  (100, 100, 1000)):
+    print("Test avec une grille {} x {} et {} trous".format(largeur, hauteur,
+                                                          trous))
+    points = [(5 + 3 * i, 7 * j - 2) for i in range(largeur)
+              for j in range(hauteur)]
+    points = sample(points, len(points) - trous)
+    triangulation = delaunay_triangulation(points)
+    test_triangulation(points, triangulation)
+    assert len(triangulation) == \
+           len(delaunay_triangulation(points, grille=False))
+
+#Grilles à coordonnées flottantes (centres de pixels) et grilles
+#accompagnées de points hors du réseau : la partie régulière doit être
+#reconnue, les autres points étant laissés à l'algorithme général.
+grilles = [[(i + 0.5, j + 0.5) for i in range(50) for j in range(40)],
+           [(10 * i, 10 * j) for i in range(50) for j in range(40)]
+           + [(3, 7), (255, 255), (101, 200)] + genere(20, 500),
+           #environ 5 % de points hors du réseau :
+           [(10 * i, 10 * j) for i in range(60) for j in range(60)]
+           + genere(180, 600),
+           [(i + 0.5, j + 0.5) for i in range(60) for j in range(60)]
+           + [(60 * random(), 60 * random()) for i in range(180)]]
+for points in grilles:
+    points = list(set(points))
+    assert delaunay_grille(points) is not None
+    triangulation = delaunay_triangulation(points)
+    test_triangulation(points, triangulation)
+    assert len(triangulation) == \
+           len(delaunay_triangulation(points, grille=False))
+
+#Tests de la triangulation périodique :
+def test_triangulation_periodique(points, largeur, hauteur, triangulation):
+    """Teste si la triangulation de Delaunay d'un ensemble de points du tore
+    plat [0, largeur[ x [0, hauteur[ est correcte.
+
+    On vérifie que chaque arête apparait dans les deux sens avec des décalages
+    opposés, que le nombre d'arêtes est 3n comme pour toute triangulation du
+    tore, et qu'aucune copie d'un point ne se trouve strictement à l'intérieur
+    du cercle circonscrit à un triangle."""
+    copies = [(x + i * largeur, y + j * hauteur) for (x, y) in points
+              for i in (-1, 0, 1) for j in (-1, 0, 1)]
+    assert len(triangulation) == 6 * len(points)
+    for (a, (b, (i, j))), (c, (k, l)) in triangulation.items():
+        assert (b, (a, (-i, -j))) in triangulation
+        b = (b[0] + i * largeur, b[1] + j * hauteur)
+        c = (c[0] + k * largeur, c[1] + l * hauteur)
+        assert orientation(a, b, c) == DIRECT
+        for d in copies:
+            assert position_cercle_circonscrit(a, b, c, d) != DEDANS
+
+points = [(i, j) for i in range(0, 100, 10) for j in range(0, 60, 10)]
+test_triangulation_periodique(
+    points, 100, 60, delaunay_triangulation_periodique(points, 100, 60))
+
+#Sans passer par la triangulation directe des grilles, les polygones de
+#points cocirculaires doivent être coupés de la même façon dans toutes les
+#copies :
+points = [(i + 0.5, j + 0.5) for i in range(10) for j in range(6)]
+test_triangulation_periodique(
+    points, 10, 6,
+    delaunay_triangulation_periodique(points, 10, 6, grille=False))
+
+points = sample([(i, j) for i in range(16) for j in range(16)], 128)
+for engine in ("dc", "incremental"):
+    test_triangulation_periodique(
+        points, 16, 16,
+        delaunay_triangulation_periodique(points, 16, 16, engine,
+                                          grille=False))
+
+for nb_points in (2, 3, 10, 100, 300):
+    print("Test périodique avec {} points aléatoires".format(nb_points))
+    points = genere(nb_points, 10000)
+    test_triangulation_periodique(
+        points, 10000, 10000,
+        delaunay_triangulation_periodique(points, 10000, 10000))
+
+#Tests avec des coordonnées et une boîte flottantes :
+points = [(random(), random()) for i in range(300)]
+test_triangulation_periodique(points, 1.0, 1.0,
+                              delaunay_triangulation_periodique(points,
+                                                                1.0, 1.0))
+points = [(1000 * x, 500 * y) for (x, y) in points]
+test_triangulation_periodique(points, 1000.0, 500.0,
+                              delaunay_triangulation_periodique(points,
+                                                                1000.0, 500.0))
+
 print("Tous les tests ont été passés avec succès.")